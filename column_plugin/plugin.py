@@ -3,12 +3,43 @@ Column Plugin for Osdag
 Main plugin class for adding Column design functionality to Osdag
 """
 
+import functools
 import os
 import sys
-import importlib
-import traceback
-from importlib.resources import files
-from PyQt5.QtWidgets import QRadioButton, QWidget, QGridLayout, QButtonGroup
+import weakref
+from collections import deque
+
+# Directory of this package and the directory containing it
+_PLUGIN_FILE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PLUGIN_ROOT_DIR = os.path.dirname(_PLUGIN_FILE_DIR)
+
+# Set to True to print extra diagnostics (e.g. dir() dumps of the main window)
+DEBUG = False
+
+# Class name of Osdag's main window, used to recognise it among top level widgets
+_MAIN_WIN_CLS = 'OsdagMainWindow'
+
+# Main window methods tried when the Column button cannot be inserted directly
+_REFRESH_METHODS = ("initialize_module_buttons", "refresh_module_list",
+                    "setup_module_buttons", "update_ui")
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_image(name, fallback_name):
+    """
+    Resolve an image from the Osdag resources once and cache the path.
+    Falls back to fallback_name in the plugin's own resources when the
+    Osdag resources are not available.
+    """
+    try:
+        from importlib.resources import files
+        # This is the correct path format that Osdag uses for resources
+        return str(files("osdag.data.ResourceFiles.images").joinpath(name))
+    except Exception as e:
+        print(f"Error loading image from Osdag resources: {e}")
+        # Fallback to plugin resources
+        return os.path.join(_PLUGIN_FILE_DIR, "column", "resources", fallback_name)
+
 
 class ColumnPlugin:
     # Plugin metadata
@@ -16,39 +47,81 @@ class ColumnPlugin:
     version = "0.1"
     description = "Adds Axially Loaded Column Design module to Osdag"
     author = "Osdag Team"
+
+    # Osdag classes resolved on first launch of the column module
+    _ui_module_window_cls = None
+    _column_design_cls = None
+
+    # Directories this plugin has already made importable through sys.path
+    _sys_path_added = set()
     
     def __init__(self):
         """
         Initialize the plugin
         """
+        self._main_win_ref = None
         self.main_win = None  # Will be set by Osdag plugin manager
+        self._cached_main_win_ref = None  # Weak reference set by find_main_window
+        self._inserted_entry = None  # Column entry added to the Modules dictionary
+        self._modules_memo = {}  # id(window) -> (window ref, Modules holder ref)
+        self._compression_page_index = None  # Set by _update_live_ui
+        self._compression_page_ref = None
+        
+    @property
+    def main_win(self):
+        """
+        The Osdag main window, held through a weak reference so the plugin does
+        not keep a window alive after Osdag tears it down
+        """
+        if self._main_win_ref is None:
+            return None
+        return self._main_win_ref()
+    
+    @main_win.setter
+    def main_win(self, window):
+        if window is None:
+            self._main_win_ref = None
+            return
+        try:
+            self._main_win_ref = weakref.ref(window, self._on_main_win_destroyed)
+        except TypeError:
+            # Objects that cannot be weakly referenced are held directly
+            self._main_win_ref = lambda: window
+    
+    def _on_main_win_destroyed(self, ref):
+        """
+        Drop state derived from the main window once it has been garbage collected
+        """
+        if self._main_win_ref is ref:
+            self._main_win_ref = None
+        self._cached_main_win_ref = None
+        self._modules_memo.clear()
+        self._compression_page_index = None
+        self._compression_page_ref = None
         
     def get_image_path(self, image_name):
         """Get path to an image resource"""
         # Try to use the image from the main osdag resources if available
-        try:
-            # This is the correct path format that Osdag uses for resources
-            return str(files("osdag.data.ResourceFiles.images").joinpath("CompressionMembers_ColumnsInFrames.png"))
-        except Exception as e:
-            print(f"Error loading image from Osdag resources: {e}")
-            # Fallback to plugin resources
-            plugin_dir = os.path.dirname(os.path.abspath(__file__))
-            return os.path.join(plugin_dir, "column", "resources", image_name)
+        return _resolve_image("CompressionMembers_ColumnsInFrames.png", image_name)
     
     def show_column_module(self, *args):
         """
         Launch the column design module
         This method will be added to the main window when the plugin is activated
         """
-        import osdag.gui.ui_template
-        from osdag.gui.ui_template import Ui_ModuleWindow
-        from osdag.modules.compression_member.Column import ColumnDesign
+        cls = type(self)
+        if cls._ui_module_window_cls is None:
+            from osdag.gui.ui_template import Ui_ModuleWindow
+            cls._ui_module_window_cls = Ui_ModuleWindow
+        if cls._column_design_cls is None:
+            from osdag.modules.compression_member.Column import ColumnDesign
+            cls._column_design_cls = ColumnDesign
         
         # Hide the main window
         if hasattr(self, "main_win") and self.main_win:
             self.main_win.hide()
             # Launch the column module
-            ui2 = Ui_ModuleWindow(ColumnDesign, ' ')
+            ui2 = cls._ui_module_window_cls(cls._column_design_cls, ' ')
             ui2.show()
             # Show the main window again when the module is closed
             ui2.closed.connect(self.main_win.show)
@@ -59,35 +132,50 @@ class ColumnPlugin:
         """
         Find the real OsdagMainWindow instance via QApplication
         """
+        # Reuse the window found by a previous call while it is still alive
+        if self._cached_main_win_ref is not None:
+            cached = self._cached_main_win_ref()
+            if cached is not None:
+                return cached
+            self._cached_main_win_ref = None
+            
         from PyQt5.QtWidgets import QApplication
         
-        # Find all top level widgets
+        # Find all top level widgets in a single pass
+        found = None
         for widget in QApplication.topLevelWidgets():
-            # Check if this is likely the OsdagMainWindow
-            if hasattr(widget, 'Modules'):
-                return widget
+            # The class name check is the cheapest, so try it first
+            if type(widget).__name__ == _MAIN_WIN_CLS:
+                found = widget
+                break
                 
-            # Check if it has a ui attribute that might be the main window
-            if hasattr(widget, 'ui'):
-                ui = widget.ui
-                # Check if the ui has Modules dictionary
-                if hasattr(ui, 'Modules'):
-                    return ui
+            # Check if this is likely the OsdagMainWindow
+            if getattr(widget, 'Modules', None) is not None:
+                found = widget
+                break
                 
-                # Check if it has myStackedWidget (a sign of OsdagMainWindow)
-                if hasattr(ui, 'myStackedWidget'):
-                    # This might be the main window's UI
-                    if hasattr(widget, 'Modules'):
-                        return widget
-        
-        # If we get here, we couldn't find the main window directly
-        # Try harder by looking for objects with the right class name
-        for widget in QApplication.topLevelWidgets():
-            if widget.__class__.__name__ == 'OsdagMainWindow':
-                return widget
+            # Check if it has a ui attribute with the Modules dictionary
+            ui = getattr(widget, 'ui', None)
+            if ui is not None and getattr(ui, 'Modules', None) is not None:
+                found = ui
+                break
                 
-        # If we still can't find it, return None
-        return None
+        if found is None:
+            return None
+            
+        # Cache the window and forget it once Qt destroys it. Plain Ui_* objects
+        # have no destroyed signal to invalidate the cache, so they are not cached
+        destroyed = getattr(found, 'destroyed', None)
+        if destroyed is not None:
+            self._cached_main_win_ref = weakref.ref(found)
+            destroyed.connect(self._clear_cached_main_win)
+        return found
+    
+    def _clear_cached_main_win(self, *args):
+        """
+        Drop the cached main window when the widget is destroyed
+        """
+        self._cached_main_win_ref = None
     
     def _find_modules_dict(self, window_obj):
         """
@@ -99,42 +187,66 @@ class ColumnPlugin:
         Returns:
             tuple: (object with Modules, Modules dict) or (None, None) if not found
         """
+        # Reuse the holder found by an earlier search of this window. Only weak
+        # references are kept, so the entry goes stale when the window is destroyed
+        memo = self._modules_memo.get(id(window_obj))
+        if memo is not None:
+            window_ref, holder_ref = memo
+            holder = holder_ref()
+            if window_ref() is window_obj and holder is not None:
+                modules = getattr(holder, 'Modules', None)
+                if modules is not None:
+                    return holder, modules
+            del self._modules_memo[id(window_obj)]
+            
+        holder, modules = self._search_modules_dict(window_obj)
+        if holder is not None:
+            try:
+                self._modules_memo[id(window_obj)] = (weakref.ref(window_obj), weakref.ref(holder))
+            except TypeError:
+                # Objects that cannot be weakly referenced are simply not cached
+                pass
+        return holder, modules
+    
+    def _search_modules_dict(self, window_obj):
+        """
+        Search the window hierarchy for the Modules dictionary, see _find_modules_dict
+        """
         # First try the window object itself
-        if hasattr(window_obj, 'Modules'):
-            return window_obj, window_obj.Modules
+        modules = getattr(window_obj, 'Modules', None)
+        if modules is not None:
+            return window_obj, modules
             
         # Try ui attribute if it exists
-        if hasattr(window_obj, 'ui'):
-            ui = window_obj.ui
-            if hasattr(ui, 'Modules'):
-                return ui, ui.Modules
+        ui = getattr(window_obj, 'ui', None)
+        modules = getattr(ui, 'Modules', None) if ui is not None else None
+        if modules is not None:
+            return ui, modules
                 
         # If we get here, we couldn't find Modules in the expected places
-        # Try harder by recursively searching the widget hierarchy
-        def search_for_modules(widget, visited=None):
-            if visited is None:
-                visited = set()
-                
-            # Skip if already visited (avoid infinite recursion)
+        # Try harder by searching the widget hierarchy depth first. An explicit
+        # stack is used instead of recursion so deep widget trees cannot exhaust
+        # the interpreter stack
+        pending = deque([window_obj])
+        visited = set()
+        while pending:
+            widget = pending.pop()
+            
+            # Skip if already visited
             if id(widget) in visited:
-                return None, None
-                
+                continue
             visited.add(id(widget))
             
             # Check this widget
-            if hasattr(widget, 'Modules'):
-                return widget, widget.Modules
+            modules = getattr(widget, 'Modules', None)
+            if modules is not None:
+                return widget, modules
                 
-            # Check its children
-            for child in widget.children():
-                result = search_for_modules(child, visited)
-                if result[0] is not None:
-                    return result
-                    
-            # Not found
-            return None, None
+            # Push its children reversed so they are visited in their original order
+            pending.extend(reversed(widget.children()))
             
-        return search_for_modules(window_obj)
+        # Not found
+        return None, None
     
     def register(self):
         """
@@ -158,9 +270,11 @@ class ColumnPlugin:
         modules_obj, modules_dict = self._find_modules_dict(real_main_window)
         if not modules_dict:
             print("Error: Could not find Modules dictionary")
-            print(f"Available attributes in main window: {dir(real_main_window)}")
-            if hasattr(real_main_window, 'ui'):
-                print(f"Available attributes in main window.ui: {dir(real_main_window.ui)}")
+            if DEBUG:
+                print(f"Available attributes in main window: {dir(real_main_window)}")
+                ui = getattr(real_main_window, 'ui', None)
+                if ui is not None:
+                    print(f"Available attributes in main window.ui: {dir(ui)}")
             return
             
         print(f"Found Modules dictionary in {modules_obj}")
@@ -182,6 +296,7 @@ class ColumnPlugin:
                     
                     # Insert at the beginning of the list, preserving the handler at the end
                     modules_dict['Compression Member'].insert(0, column_entry)
+                    self._inserted_entry = column_entry
                     
                     print(f"Added Column module to Compression Member module:")
                     print(f"  - Entry: {column_entry}")
@@ -191,22 +306,16 @@ class ColumnPlugin:
                     # and will check for the Column_Design radio button
                     show_column_original = real_main_window.show_compression_module
                     
-                    # Import the ColumnDesign class in the main namespace for the show_column_module
-                    # handler to find it when the module is selected
-                    try:
-                        from osdag.design_type.compression_member.Column import ColumnDesign
-                        print("Successfully imported ColumnDesign class")
-                    except ImportError as e:
-                        print(f"Warning: Could not import ColumnDesign: {e}")
-                        print("Module activation may fail if ColumnDesign class is not available")
-                        
                     # Attempt to immediately update the UI
                     self._update_live_ui(real_main_window)
                     
                     # Make our plugin directory available for imports
-                    plugin_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                    if plugin_dir not in sys.path:
-                        sys.path.append(plugin_dir)
+                    plugin_dir = _PLUGIN_ROOT_DIR
+                    # sys.path is only scanned and mutated once per directory per process
+                    if plugin_dir not in ColumnPlugin._sys_path_added:
+                        ColumnPlugin._sys_path_added.add(plugin_dir)
+                        if plugin_dir not in sys.path:
+                            sys.path.append(plugin_dir)
                     
                     print(f"Column Plugin activated! Column module added to Compression Member.")
                     
@@ -218,17 +327,79 @@ class ColumnPlugin:
             print("Error: Compression Member module not found in Modules dictionary")
             print(f"Available modules: {list(modules_dict.keys())}")
     
+    def _get_cached_compression_page(self, stack):
+        """
+        Get the (index, page) of the compression page found by _update_live_ui,
+        or None if that page was destroyed or is no longer at the same index
+        """
+        if self._compression_page_ref is None:
+            return None
+        page = self._compression_page_ref()
+        index = self._compression_page_index
+        if page is None or index >= stack.count() or stack.widget(index) is not page:
+            self._compression_page_index = None
+            self._compression_page_ref = None
+            return None
+        return index, page
+    
+    def _get_radio_buttons(self, page):
+        """
+        Collect the radio buttons of a page in one walk, keyed by objectName.
+        Like findChild, the first button with a given name wins
+        """
+        from PyQt5.QtWidgets import QRadioButton
+        
+        radio_buttons = {}
+        for button in page.findChildren(QRadioButton):
+            radio_buttons.setdefault(button.objectName(), button)
+        return radio_buttons
+    
+    def _get_button_group(self, page):
+        """
+        Get the first button group of a page, caching it on the page so later
+        activations do not have to search the page again
+        """
+        button_group = getattr(page, '_column_plugin_bgroup', None)
+        if button_group is not None:
+            # Osdag may have deleted and rebuilt the group since it was cached.
+            # Calling into a deleted wrapper raises RuntimeError
+            try:
+                if button_group.parent() is page:
+                    return button_group
+            except RuntimeError:
+                pass
+            page._column_plugin_bgroup = None
+            
+        from PyQt5.QtCore import Qt
+        from PyQt5.QtWidgets import QButtonGroup
+        
+        # The group is normally a direct child of the page, so avoid the
+        # recursive search unless that fails
+        button_groups = page.findChildren(QButtonGroup, options=Qt.FindDirectChildrenOnly)
+        if not button_groups:
+            button_groups = page.findChildren(QButtonGroup)
+        if not button_groups:
+            return None
+            
+        page._column_plugin_bgroup = button_groups[0]
+        return button_groups[0]
+    
     def _update_live_ui(self, window_obj):
         """
         Update the UI to reflect changes in the modules dictionary
         """
+        from PyQt5.QtWidgets import QGridLayout
+
         try:
             print("Attempting immediate UI update...")
             
+            # Set once the compression page is found and a direct rebuild is tried
+            direct_attempted = False
+            
             # Find the Compression Member page in the stackedWidget
-            if hasattr(window_obj, 'ui') and hasattr(window_obj.ui, 'myStackedWidget'):
-                stack = window_obj.ui.myStackedWidget
-                
+            ui = getattr(window_obj, 'ui', None)
+            stack = getattr(ui, 'myStackedWidget', None) if ui is not None else None
+            if stack is not None:
                 # Look for the page with the Compression Member module
                 for i in range(stack.count()):
                     page = stack.widget(i)
@@ -238,32 +409,45 @@ class ColumnPlugin:
                         print(f"Found page at index {i}: {page.__class__.__name__}")
                         
                         # Check if this is likely the compression page
-                        if hasattr(page, 'findChild'):
-                            strut_button = page.findChild(QRadioButton, 'Strut_Design')
+                        if hasattr(page, 'findChildren'):
+                            radio_buttons = self._get_radio_buttons(page)
+                            strut_button = radio_buttons.get('Strut_Design')
                             if strut_button is not None:
                                 print(f"Found Compression Member page at index {i}")
+                                direct_attempted = True
+                                self._compression_page_index = i
+                                self._compression_page_ref = weakref.ref(page)
                                 
                                 # This is the compression member page - now we need to rebuild the UI
                                 # First, remove any existing Column_Design button if it exists
-                                column_button = page.findChild(QRadioButton, 'Column_Design')
+                                page_ui = getattr(page, 'ui', None)
+                                grid_layout = getattr(page_ui, 'gridLayout', None) if page_ui is not None else None
+                                column_button = radio_buttons.get('Column_Design')
+                                
+                                # Nothing to rebuild if the Column button is already in place at 0,0
+                                if column_button is not None and grid_layout is not None:
+                                    first_item = grid_layout.itemAtPosition(0, 0)
+                                    if first_item is not None and first_item.widget() is column_button.parent():
+                                        print("Column module already present in the UI")
+                                        return True
+                                        
                                 if column_button is not None:
                                     # Get its parent widget and remove it
                                     column_widget = column_button.parent()
                                     if column_widget is not None:
                                         # Remove from layout
                                         print(f"Removing existing Column button widget")
-                                        if hasattr(page, 'ui') and hasattr(page.ui, 'gridLayout'):
-                                            page.ui.gridLayout.removeWidget(column_widget)
+                                        if grid_layout is not None:
+                                            grid_layout.removeWidget(column_widget)
                                             column_widget.deleteLater()
                                 
                                 # Now rebuild the module widgets using proper Osdag layout logic
-                                if hasattr(page, 'ui') and hasattr(page.ui, 'gridLayout'):
-                                    grid_layout = page.ui.gridLayout
+                                if grid_layout is not None:
                                     print(f"Found gridLayout in page")
                                     
                                     try:
                                         # Get image path using proper Osdag resource format
-                                        image_path = str(files("osdag.data.ResourceFiles.images").joinpath("CompressionMembers_ColumnsInFrames.png"))
+                                        image_path = self.get_image_path("column.png")
                                         
                                         # Create a widget for our column module using Osdag's widget classes
                                         from osdag.osdagMainPage import Submodule_Widget
@@ -275,24 +459,33 @@ class ColumnPlugin:
                                         widget = Submodule_Widget(module_tuple, page)
                                         
                                         # Find existing button group to add our radio button
-                                        button_groups = page.findChildren(QButtonGroup)
-                                        if button_groups:
-                                            button_group = button_groups[0]
+                                        button_group = self._get_button_group(page)
+                                        if button_group is not None:
                                             button_group.addButton(widget.rdbtn)
                                         
-                                        # Add to grid layout at position 0,0 (to appear first/left)
-                                        grid_layout.addWidget(widget, 0, 0)
-                                        
-                                        # Move Strut button to position 0,1
-                                        if strut_button is not None:
-                                            strut_widget = strut_button.parent()
-                                            if strut_widget is not None:
-                                                grid_layout.removeWidget(strut_widget)
-                                                grid_layout.addWidget(strut_widget, 0, 1)
+                                        # Freeze painting and layout while the grid is rearranged
+                                        # so Qt redraws the page once instead of after every change
+                                        page.setUpdatesEnabled(False)
+                                        grid_layout.setEnabled(False)
+                                        try:
+                                            # Add to grid layout at position 0,0 (to appear first/left)
+                                            grid_layout.addWidget(widget, 0, 0)
+                                            
+                                            # Move Strut button to position 0,1
+                                            if strut_button is not None:
+                                                strut_widget = strut_button.parent()
+                                                if strut_widget is not None:
+                                                    grid_layout.removeWidget(strut_widget)
+                                                    grid_layout.addWidget(strut_widget, 0, 1)
+                                        finally:
+                                            grid_layout.setEnabled(True)
+                                            grid_layout.activate()
+                                            page.setUpdatesEnabled(True)
                                         
                                         print("Successfully rebuilt UI with Column module")
                                         return True
-                                    except Exception as e:
+                                    except (AttributeError, ImportError, RuntimeError) as e:
+                                        import traceback
                                         print(f"Error creating widget: {str(e)}")
                                         traceback.print_exc()
                                 else:
@@ -309,18 +502,21 @@ class ColumnPlugin:
             else:
                 print("Could not find UI or stackedWidget for immediate update")
             
-            # Method 2: Try to call refresh methods on main window
+            # Method 2: Try to call refresh methods on main window, but only when
+            # the direct rebuild was tried and failed. Without the compression
+            # page a full refresh of the main window is unlikely to help
             ui_updated = False
-            for method_name in ["initialize_module_buttons", "refresh_module_list", 
-                               "setup_module_buttons", "update_ui"]:
-                if hasattr(window_obj, method_name) and callable(getattr(window_obj, method_name)):
-                    try:
-                        print(f"Calling {method_name} on main window...")
-                        getattr(window_obj, method_name)()
-                        print(f"Successfully called {method_name}")
-                        ui_updated = True
-                    except Exception as e:
-                        print(f"Error calling {method_name}: {e}")
+            if direct_attempted:
+                for method_name in _REFRESH_METHODS:
+                    method = getattr(window_obj, method_name, None)
+                    if callable(method):
+                        try:
+                            print(f"Calling {method_name} on main window...")
+                            method()
+                            print(f"Successfully called {method_name}")
+                            ui_updated = True
+                        except Exception as e:
+                            print(f"Error calling {method_name}: {e}")
             
             if ui_updated:
                 print("UI update attempted through multiple methods")
@@ -333,7 +529,8 @@ class ColumnPlugin:
                 print("UI update failed - changes will be visible after restart")
                 return False
                     
-        except Exception as e:
+        except (AttributeError, ImportError, RuntimeError) as e:
+            import traceback
             print(f"Error in _update_live_ui: {e}")
             traceback.print_exc()
             return False
@@ -355,9 +552,9 @@ class ColumnPlugin:
             real_main_window = self.main_win
             
         # Check if Column module is open and close it
-        if hasattr(real_main_window, 'module_window') and real_main_window.module_window:
-            if hasattr(real_main_window, 'module_name') and real_main_window.module_name == 'Column':
-                real_main_window.module_window.close()
+        module_window = getattr(real_main_window, 'module_window', None)
+        if module_window and getattr(real_main_window, 'module_name', None) == 'Column':
+            module_window.close()
                 
         # Find the Modules dictionary
         modules_obj, modules_dict = self._find_modules_dict(real_main_window)
@@ -371,40 +568,59 @@ class ColumnPlugin:
             
             # Check if compression module is a list (as expected)
             if isinstance(compression_module, list):
-                # Look for the Column entry
-                for i, item in enumerate(compression_module):
-                    if isinstance(item, tuple) and len(item) >= 3:
-                        if item[2] == 'Column_Design':
-                            # Remove the entry
-                            modules_dict['Compression Member'].pop(i)
-                            print("Removed Column module from Compression Member module")
-                            break
+                # Remove the entry added by register directly if we still have it
+                removed = False
+                if self._inserted_entry is not None:
+                    try:
+                        compression_module.remove(self._inserted_entry)
+                        removed = True
+                        print("Removed Column module from Compression Member module")
+                    except ValueError:
+                        pass
+                    self._inserted_entry = None
+                    
+                if not removed:
+                    # Otherwise look for the Column entry
+                    for i, item in enumerate(compression_module):
+                        if isinstance(item, tuple) and len(item) >= 3:
+                            if item[2] == 'Column_Design':
+                                # Remove the entry
+                                modules_dict['Compression Member'].pop(i)
+                                print("Removed Column module from Compression Member module")
+                                break
                             
                 # Try to update the UI
                 print("Attempting immediate UI update...")
-                if hasattr(real_main_window, 'ui') and hasattr(real_main_window.ui, 'myStackedWidget'):
-                    stack = real_main_window.ui.myStackedWidget
-                    
+                ui = getattr(real_main_window, 'ui', None)
+                stack = getattr(ui, 'myStackedWidget', None) if ui is not None else None
+                if stack is not None:
                     # Look for the Compression Member page
-                    for i in range(stack.count()):
-                        page = stack.widget(i)
-                        
+                    # Start from the page found on activation, scanning only if it is gone
+                    cached = self._get_cached_compression_page(stack)
+                    if cached is not None:
+                        pages = [cached]
+                    else:
+                        pages = ((i, stack.widget(i)) for i in range(stack.count()))
+                    for i, page in pages:
                         # Check if this is the compression member page
-                        if page is not None and hasattr(page, 'findChild'):
-                            strut_button = page.findChild(QRadioButton, 'Strut_Design')
+                        if page is not None and hasattr(page, 'findChildren'):
+                            radio_buttons = self._get_radio_buttons(page)
+                            strut_button = radio_buttons.get('Strut_Design')
                             if strut_button is not None:
                                 print(f"Found Compression Member page at index {i}")
                                 
                                 # Find and remove any Column_Design button
-                                column_button = page.findChild(QRadioButton, 'Column_Design')
+                                column_button = radio_buttons.get('Column_Design')
                                 if column_button is not None:
                                     # Get its parent widget and remove it
                                     column_widget = column_button.parent()
                                     if column_widget is not None:
                                         # Remove from layout
                                         print(f"Removing Column button widget")
-                                        if hasattr(page, 'ui') and hasattr(page.ui, 'gridLayout'):
-                                            page.ui.gridLayout.removeWidget(column_widget)
+                                        page_ui = getattr(page, 'ui', None)
+                                        grid_layout = getattr(page_ui, 'gridLayout', None) if page_ui is not None else None
+                                        if grid_layout is not None:
+                                            grid_layout.removeWidget(column_widget)
                                             column_widget.deleteLater()
                                         else:
                                             print("Could not find gridLayout in page")